@@ -26,11 +26,14 @@ Network: docking_specialized_bn.xdsl (24 nodes)
 
 import rclpy
 from rclpy.node import Node
+from rclpy.logging import LoggingSeverity
+from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy
 from std_msgs.msg import Float32, String, Int32, Bool
 from geometry_msgs.msg import PoseStamped
 import pysmile
 import math
-from datetime import datetime
+from collections import deque
+import bisect
 from ament_index_python.packages import get_package_share_directory
 import os
 
@@ -55,6 +58,22 @@ pysmile.License((
 
 
 class DockingBayesianNetwork(Node):
+    # DockingStationDetection state by ArUco visibility when the station is detected:
+    # All → Detected (≥10 markers), Some → Partial (3-9 markers), else NotDetected
+    DETECTION_STATE_MAP = {'All': 0, 'Some': 1}
+
+    # USBLStrength states: Strong (0), Moderate (1), Weak (2), Lost (3)
+    USBL_STATE_MAP = {'strong': 0, 'moderate': 1, 'weak': 2, 'lost': 3}
+    # CameraQuality states: Excellent (0), Good (1), Poor (2), Failed (3)
+    CAMERA_STATE_MAP = {'excellent': 0, 'good': 1, 'poor': 2, 'failed': 3}
+    # ArUcoMarkersVisible states: All (0), Some (1), None (2)
+    ARUCO_STATE_MAP = {'All': 0, 'Some': 1, 'None': 2}
+
+    # Expected value of each reliability state (VeryHigh ... VeryLow)
+    RELIABILITY_VALUES = (0.975, 0.90, 0.775, 0.60, 0.375)
+    # Expected value of each SituationalAwareness state
+    SITUATIONAL_AWARENESS_VALUES = (0.95, 0.80, 0.55, 0.25)
+
     def __init__(self):
         super().__init__('docking_bayesian_network')
         
@@ -99,8 +118,13 @@ class DockingBayesianNetwork(Node):
         }
 
         # Historical data for pose quality
-        self.pose_history = []
         self.max_history = 20
+        self.pose_history = deque(maxlen=self.max_history)
+
+        # Last hard-evidence state set on each BN node
+        self.evidence_states = {}
+        # Set when evidence changes so inference only reruns when needed
+        self.beliefs_stale = True
 
         # Mission timer for fatigue calculation
         self.mission_start_time = self.get_clock().now()
@@ -119,10 +143,17 @@ class DockingBayesianNetwork(Node):
 
     def setup_subscribers(self):
         """Setup ROS2 topic subscribers for docking evidence nodes"""
-        
+
+        # Numeric telemetry: only the latest sample matters, so keep one and
+        # skip DDS retransmits
+        scalar_qos = QoSProfile(
+            history=HistoryPolicy.KEEP_LAST,
+            depth=1,
+            reliability=ReliabilityPolicy.BEST_EFFORT)
+
         # Vehicle state sensors (reuse from full mission)
         self.speed_sub = self.create_subscription(
-            Float32, '/blueye/speed', self.speed_callback, 10)
+            Float32, '/blueye/speed', self.speed_callback, scalar_qos)
         
         self.usbl_sub = self.create_subscription(
             String, '/blueye/usbl_strength', self.usbl_callback, 10)
@@ -131,14 +162,14 @@ class DockingBayesianNetwork(Node):
             String, '/blueye/camera_quality', self.camera_callback, 10)
         
         self.battery_sub = self.create_subscription(
-            Float32, '/blueye/battery_level', self.battery_callback, 10)
+            Float32, '/blueye/battery_level', self.battery_callback, scalar_qos)
         
         self.altitude_sub = self.create_subscription(
-            Float32, '/blueye/altitude', self.altitude_callback, 10)
+            Float32, '/blueye/altitude', self.altitude_callback, scalar_qos)
         
         # Environmental (only Current for docking)
         self.current_sub = self.create_subscription(
-            Float32, '/blueye/current', self.current_callback, 10)
+            Float32, '/blueye/current', self.current_callback, scalar_qos)
         
         # Docking-specific: ArUco detection
         self.aruco_visibility_sub = self.create_subscription(
@@ -149,7 +180,7 @@ class DockingBayesianNetwork(Node):
         
         # Docking-specific: Fish-based clearance
         self.fish_count_sub = self.create_subscription(
-            Int32, '/fish_detection/count', self.fish_count_callback, 10)
+            Int32, '/fish_detection/count', self.fish_count_callback, scalar_qos)
         
         # Pose estimation (for quality assessment)
         self.pose_sub = self.create_subscription(
@@ -158,10 +189,10 @@ class DockingBayesianNetwork(Node):
         
         # Human operator state (optional - can be manual or time-based)
         self.fatigue_sub = self.create_subscription(
-            Float32, '/blueye/human/fatigue', self.fatigue_callback, 10)
+            Float32, '/blueye/human/fatigue', self.fatigue_callback, scalar_qos)
         
         self.stress_sub = self.create_subscription(
-            Float32, '/blueye/human/stress', self.stress_callback, 10)
+            Float32, '/blueye/human/stress', self.stress_callback, scalar_qos)
 
         self.get_logger().info('✓ All ROS2 subscribers initialized')
 
@@ -190,6 +221,15 @@ class DockingBayesianNetwork(Node):
         self.mode_shared_pub = self.create_publisher(
             Float32, '/docking/mode_shared_prob', 10)
 
+        # Output messages are reused across ticks; only .data changes
+        self.mode_msg = String()
+        self.reliability_msg = Float32()
+        self.visual_guidance_msg = String()
+        self.approach_feasibility_msg = String()
+        self.mode_auto_msg = Float32()
+        self.mode_human_msg = Float32()
+        self.mode_shared_msg = Float32()
+
         self.get_logger().info('✓ Docking output publishers initialized')
 
     # ============================================
@@ -206,17 +246,12 @@ class DockingBayesianNetwork(Node):
         self.sensor_data['aruco_visibility'] = visibility
         
         # ArUcoMarkersVisible states: All (0), Some (1), None (2)
-        state_map = {
-            'All': 0,
-            'Some': 1,
-            'None': 2
-        }
-        
-        state = state_map.get(visibility, 2)
+        state = self.ARUCO_STATE_MAP.get(visibility, 2)
         
         try:
-            self.net.set_evidence("ArUcoMarkersVisible", state)
-            self.get_logger().debug(f'ArUco Visibility: {visibility} → state {state}')
+            self.set_evidence("ArUcoMarkersVisible", state)
+            if self.get_logger().is_enabled_for(LoggingSeverity.DEBUG):
+                self.get_logger().debug(f'ArUco Visibility: {visibility} → state {state}')
         except Exception as e:
             self.get_logger().warning(f'Failed to set ArUcoMarkersVisible: {e}')
 
@@ -233,15 +268,10 @@ class DockingBayesianNetwork(Node):
         aruco_vis = self.sensor_data.get('aruco_visibility', 'None')
         
         # DockingStationDetection states: Detected (0), Partial (1), NotDetected (2)
-        if detected and aruco_vis == 'All':
-            state = 0  # Detected (≥10 markers)
-        elif detected and aruco_vis == 'Some':
-            state = 1  # Partial (3-9 markers)
-        else:
-            state = 2  # NotDetected (<3 markers)
+        state = self.DETECTION_STATE_MAP.get(aruco_vis, 2) if detected else 2
         
         try:
-            self.net.set_evidence("DockingStationDetection", state)
+            self.set_evidence("DockingStationDetection", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set DockingStationDetection: {e}')
 
@@ -264,7 +294,7 @@ class DockingBayesianNetwork(Node):
             state = 2  # Unknown
         
         try:
-            self.net.set_evidence("DockingClearance", state)
+            self.set_evidence("DockingClearance", state)
             if fish_count > 0:
                 self.get_logger().info(f'⚠️  Docking clearance OBSTRUCTED: {fish_count} fish detected')
         except Exception as e:
@@ -285,12 +315,8 @@ class DockingBayesianNetwork(Node):
             'x': msg.pose.position.x,
             'y': msg.pose.position.y,
             'z': msg.pose.position.z,
-            'timestamp': self.get_clock().now()
         })
         
-        if len(self.pose_history) > self.max_history:
-            self.pose_history.pop(0)
-        
         # Calculate pose quality from stability
         # PoseEstimationQuality states: High (0), Medium (1), Low (2)
         if len(self.pose_history) >= 10:
@@ -308,8 +334,8 @@ class DockingBayesianNetwork(Node):
             error_state = 2 - pose_state
             
             try:
-                self.net.set_evidence("PoseEstimationQuality", pose_state)
-                self.net.set_evidence("PositionError", error_state)
+                self.set_evidence("PoseEstimationQuality", pose_state)
+                self.set_evidence("PositionError", error_state)
             except Exception as e:
                 self.get_logger().warning(f'Failed to set pose evidence: {e}')
 
@@ -330,7 +356,7 @@ class DockingBayesianNetwork(Node):
             state = 2  # High
         
         try:
-            self.net.set_evidence("Speed", state)
+            self.set_evidence("Speed", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Speed: {e}')
 
@@ -339,11 +365,10 @@ class DockingBayesianNetwork(Node):
         usbl_str = msg.data.lower()
         self.sensor_data['usbl_strength'] = usbl_str
         
-        state_map = {'strong': 0, 'moderate': 1, 'weak': 2, 'lost': 3}
-        state = state_map.get(usbl_str, 2)
+        state = self.USBL_STATE_MAP.get(usbl_str, 2)
         
         try:
-            self.net.set_evidence("USBLStrength", state)
+            self.set_evidence("USBLStrength", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set USBLStrength: {e}')
 
@@ -352,11 +377,10 @@ class DockingBayesianNetwork(Node):
         camera_str = msg.data.lower()
         self.sensor_data['camera_quality'] = camera_str
         
-        state_map = {'excellent': 0, 'good': 1, 'poor': 2, 'failed': 3}
-        state = state_map.get(camera_str, 2)
+        state = self.CAMERA_STATE_MAP.get(camera_str, 2)
         
         try:
-            self.net.set_evidence("CameraQuality", state)
+            self.set_evidence("CameraQuality", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set CameraQuality: {e}')
 
@@ -375,7 +399,7 @@ class DockingBayesianNetwork(Node):
             state = 3  # Critical
         
         try:
-            self.net.set_evidence("BatteryLevel", state)
+            self.set_evidence("BatteryLevel", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set BatteryLevel: {e}')
 
@@ -392,7 +416,7 @@ class DockingBayesianNetwork(Node):
             state = 2  # Unsafe
         
         try:
-            self.net.set_evidence("Altitude", state)
+            self.set_evidence("Altitude", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Altitude: {e}')
 
@@ -409,7 +433,7 @@ class DockingBayesianNetwork(Node):
             state = 2  # High
         
         try:
-            self.net.set_evidence("Current", state)
+            self.set_evidence("Current", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Current: {e}')
 
@@ -426,7 +450,7 @@ class DockingBayesianNetwork(Node):
         state = self.discretize(fatigue, [0.3, 0.6])
         
         try:
-            self.net.set_evidence("Fatigue", state)
+            self.set_evidence("Fatigue", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Fatigue: {e}')
 
@@ -439,7 +463,7 @@ class DockingBayesianNetwork(Node):
         state = self.discretize(stress, [0.3, 0.6])
         
         try:
-            self.net.set_evidence("Stress", state)
+            self.set_evidence("Stress", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Stress: {e}')
 
@@ -450,8 +474,10 @@ class DockingBayesianNetwork(Node):
     def periodic_update(self):
         """Perform BN inference and publish results"""
         try:
-            # Run inference
-            self.net.update_beliefs()
+            # Run inference (posteriors are unchanged if no evidence changed)
+            if self.beliefs_stale:
+                self.net.update_beliefs()
+                self.beliefs_stale = False
             
             # Get docking-specific results
             docking_rel_probs = self.net.get_node_value("DockingReliability")
@@ -459,17 +485,14 @@ class DockingBayesianNetwork(Node):
             mode_states = self.net.get_outcome_ids("DockingModeRecommendation")
             
             # Publish mode probabilities (ADD THIS)
-            auto_prob_msg = Float32()
-            auto_prob_msg.data = float(mode_probs[0])
-            self.mode_auto_pub.publish(auto_prob_msg)
+            self.mode_auto_msg.data = float(mode_probs[0])
+            self.mode_auto_pub.publish(self.mode_auto_msg)
 
-            human_prob_msg = Float32()
-            human_prob_msg.data = float(mode_probs[1])
-            self.mode_human_pub.publish(human_prob_msg)
+            self.mode_human_msg.data = float(mode_probs[1])
+            self.mode_human_pub.publish(self.mode_human_msg)
 
-            shared_prob_msg = Float32()
-            shared_prob_msg.data = float(mode_probs[2])
-            self.mode_shared_pub.publish(shared_prob_msg)
+            self.mode_shared_msg.data = float(mode_probs[2])
+            self.mode_shared_pub.publish(self.mode_shared_msg)
             
             # Get intermediate assessments
             visual_guid_probs = self.net.get_node_value("VisualGuidanceQuality")
@@ -478,14 +501,8 @@ class DockingBayesianNetwork(Node):
             approach_feas_probs = self.net.get_node_value("ApproachFeasibility")
             approach_feas_states = self.net.get_outcome_ids("ApproachFeasibility")
             
-            sitaware_probs = self.net.get_node_value("SituationalAwareness")
-            auto_rel_probs = self.net.get_node_value("AutonomousControlReliability")
-            
             # Calculate expected reliabilities
-            reliability_values = [0.975, 0.90, 0.775, 0.60, 0.375]
-            expected_docking_rel = sum(p * v for p, v in zip(docking_rel_probs, reliability_values))
-            expected_auto_rel = sum(p * v for p, v in zip(auto_rel_probs, reliability_values))
-            expected_sitaware = sum(p * v for p, v in zip(sitaware_probs, [0.95, 0.80, 0.55, 0.25]))
+            expected_docking_rel = sum(p * v for p, v in zip(docking_rel_probs, self.RELIABILITY_VALUES))
             
             # Find best modes
             best_mode_idx = mode_probs.index(max(mode_probs))
@@ -499,70 +516,88 @@ class DockingBayesianNetwork(Node):
             approach_status = approach_feas_states[best_approach_idx]
             
             # Publish outputs
-            mode_msg = String()
-            mode_msg.data = recommended_mode
-            self.mode_pub.publish(mode_msg)
-            
-            rel_msg = Float32()
-            rel_msg.data = float(expected_docking_rel)
-            self.reliability_pub.publish(rel_msg)
-            
-            visual_msg = String()
-            visual_msg.data = visual_quality
-            self.visual_guidance_pub.publish(visual_msg)
-            
-            approach_msg = String()
-            approach_msg.data = approach_status
-            self.approach_feasibility_pub.publish(approach_msg)
-            
-            # Comprehensive logging
-            self.get_logger().info('=' * 80)
-            self.get_logger().info('DOCKING BAYESIAN NETWORK - RISK ASSESSMENT')
-            self.get_logger().info('=' * 80)
+            self.mode_msg.data = recommended_mode
+            self.mode_pub.publish(self.mode_msg)
             
-            self.get_logger().info('\n📡 DOCKING SENSORS:')
-            self.get_logger().info(f'  ArUco Markers: {self.sensor_data.get("aruco_visibility", "N/A")}')
-            self.get_logger().info(f'  Station Detected: {self.sensor_data.get("docking_detected", "N/A")}')
-            self.get_logger().info(f'  Fish Count: {self.sensor_data.get("fish_count", "N/A")}')
-            self.get_logger().info(f'  Camera Quality: {self.sensor_data.get("camera_quality", "N/A")}')
-            self.get_logger().info(f'  USBL Strength: {self.sensor_data.get("usbl_strength", "N/A")}')
+            self.reliability_msg.data = float(expected_docking_rel)
+            self.reliability_pub.publish(self.reliability_msg)
             
-            self.get_logger().info('\n🎯 DOCKING ASSESSMENT:')
-            self.get_logger().info(f'  Visual Guidance: {visual_quality}')
-            self.get_logger().info(f'  Approach Feasibility: {approach_status}')
-            self.get_logger().info(f'  Docking Reliability: {expected_docking_rel:.3f}')
+            self.visual_guidance_msg.data = visual_quality
+            self.visual_guidance_pub.publish(self.visual_guidance_msg)
             
-            self.get_logger().info('\n🤖 SYSTEM STATE:')
-            self.get_logger().info(f'  Autonomous Reliability: {expected_auto_rel:.3f}')
-            self.get_logger().info(f'  Operator Situational Awareness: {expected_sitaware:.3f}')
+            self.approach_feasibility_msg.data = approach_status
+            self.approach_feasibility_pub.publish(self.approach_feasibility_msg)
             
-            self.get_logger().info('\n✨ DOCKING MODE RECOMMENDATION:')
-            self.get_logger().info(f'  Autonomous: {mode_probs[0]:6.2%}  {"█" * int(mode_probs[0] * 30)}')
-            self.get_logger().info(f'  Human:      {mode_probs[1]:6.2%}  {"█" * int(mode_probs[1] * 30)}')
-            self.get_logger().info(f'  Shared:     {mode_probs[2]:6.2%}  {"█" * int(mode_probs[2] * 30)}')
-            self.get_logger().info(f'\n  ➜ RECOMMENDED: {recommended_mode.upper()} (Confidence: {mode_confidence:.1%})')
+            # Comprehensive logging (only built when INFO output is enabled)
+            if self.get_logger().is_enabled_for(LoggingSeverity.INFO):
+                self.log_status(visual_quality, approach_status, expected_docking_rel,
+                                mode_probs, recommended_mode, mode_confidence)
             
             if mode_confidence < 0.5:
                 self.get_logger().warn('  ⚠️  WARNING: Low confidence - consider shared control')
             
-            if self.sensor_data.get('fish_count', 0) > 0:
-                self.get_logger().warn(f'  🐟 CLEARANCE ISSUE: {self.sensor_data["fish_count"]} fish in docking area!')
-            
-            self.get_logger().info('=' * 80 + '\n')
+            fish_count = self.sensor_data.get('fish_count') or 0
+            if fish_count > 0:
+                self.get_logger().warn(f'  🐟 CLEARANCE ISSUE: {fish_count} fish in docking area!')
             
         except Exception as e:
             self.get_logger().error(f'Network update error: {e}')
 
+    def log_status(self, visual_quality, approach_status, expected_docking_rel,
+                   mode_probs, recommended_mode, mode_confidence):
+        """Log the docking risk assessment dashboard as a single multi-line record"""
+        sitaware_probs = self.net.get_node_value("SituationalAwareness")
+        auto_rel_probs = self.net.get_node_value("AutonomousControlReliability")
+        
+        expected_auto_rel = sum(p * v for p, v in zip(auto_rel_probs, self.RELIABILITY_VALUES))
+        expected_sitaware = sum(p * v for p, v in zip(sitaware_probs, self.SITUATIONAL_AWARENESS_VALUES))
+        
+        data = self.sensor_data
+        self.get_logger().info(
+            f'{"=" * 80}\n'
+            'DOCKING BAYESIAN NETWORK - RISK ASSESSMENT\n'
+            f'{"=" * 80}\n'
+            '\n📡 DOCKING SENSORS:\n'
+            f'  ArUco Markers: {data.get("aruco_visibility", "N/A")}\n'
+            f'  Station Detected: {data.get("docking_detected", "N/A")}\n'
+            f'  Fish Count: {data.get("fish_count", "N/A")}\n'
+            f'  Camera Quality: {data.get("camera_quality", "N/A")}\n'
+            f'  USBL Strength: {data.get("usbl_strength", "N/A")}\n'
+            '\n🎯 DOCKING ASSESSMENT:\n'
+            f'  Visual Guidance: {visual_quality}\n'
+            f'  Approach Feasibility: {approach_status}\n'
+            f'  Docking Reliability: {expected_docking_rel:.3f}\n'
+            '\n🤖 SYSTEM STATE:\n'
+            f'  Autonomous Reliability: {expected_auto_rel:.3f}\n'
+            f'  Operator Situational Awareness: {expected_sitaware:.3f}\n'
+            '\n✨ DOCKING MODE RECOMMENDATION:\n'
+            f'  Autonomous: {mode_probs[0]:6.2%}  {"█" * int(mode_probs[0] * 30)}\n'
+            f'  Human:      {mode_probs[1]:6.2%}  {"█" * int(mode_probs[1] * 30)}\n'
+            f'  Shared:     {mode_probs[2]:6.2%}  {"█" * int(mode_probs[2] * 30)}\n'
+            f'\n  ➜ RECOMMENDED: {recommended_mode.upper()} (Confidence: {mode_confidence:.1%})\n'
+            f'{"=" * 80}\n'
+        )
+
     # ============================================
     # UTILITY FUNCTIONS
     # ============================================
 
+    def set_evidence(self, node_id: str, state: int):
+        """Set hard evidence on a BN node, skipping repeats of the current state"""
+        if self.evidence_states.get(node_id) == state:
+            return
+        self.net.set_evidence(node_id, state)
+        self.evidence_states[node_id] = state
+        self.beliefs_stale = True
+
     def discretize(self, value: float, thresholds: list) -> int:
         """Convert continuous value to discrete state"""
-        for i, threshold in enumerate(thresholds):
-            if value <= threshold:
-                return i
-        return len(thresholds)
+        # NaN compares false against every threshold; map it to the last
+        # (least favourable) state as the original loop did
+        if math.isnan(value):
+            return len(thresholds)
+        # First index whose threshold is >= value
+        return bisect.bisect_left(thresholds, value)
 
     def calculate_position_variance(self):
         """Calculate position variance for pose quality"""
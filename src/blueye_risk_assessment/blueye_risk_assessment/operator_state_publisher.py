@@ -27,10 +27,15 @@ Usage Examples:
 import rclpy
 from rclpy.node import Node
 from std_msgs.msg import Float32
-from datetime import datetime
+import math
+import bisect
 
 
 class OperatorStatePublisher(Node):
+    # Upper bounds (inclusive) of the Low and Medium fatigue/stress categories
+    CATEGORY_THRESHOLDS = (0.3, 0.6)
+    CATEGORY_LABELS = ('Low', 'Medium', 'High')
+
     def __init__(self):
         super().__init__('operator_state_publisher')
         
@@ -129,32 +134,30 @@ class OperatorStatePublisher(Node):
         stress_msg.data = float(self.current_stress)
         self.stress_pub.publish(stress_msg)
         
-        # Log periodically (every 30 seconds)
-        if int(elapsed) % 30 == 0 and int(elapsed) > 0:
+        # Log periodically (every 30 seconds), using whole seconds
+        elapsed_s = int(elapsed)
+        if elapsed_s > 0 and elapsed_s % 30 == 0:
+            minutes, seconds = divmod(elapsed_s, 60)
             self.get_logger().info(
                 f'Operator State | '
                 f'Fatigue: {self.current_fatigue:.3f} ({self.get_fatigue_category()}) | '
                 f'Stress: {self.current_stress:.3f} ({self.get_stress_category()}) | '
-                f'Mission time: {int(elapsed/60)}:{int(elapsed%60):02d}'
+                f'Mission time: {minutes}:{seconds:02d}'
             )
     
     def get_fatigue_category(self):
         """Convert fatigue to category for logging"""
-        if self.current_fatigue <= 0.3:
-            return "Low"
-        elif self.current_fatigue <= 0.6:
-            return "Medium"
-        else:
-            return "High"
+        return self.get_category(self.current_fatigue)
     
     def get_stress_category(self):
         """Convert stress to category for logging"""
-        if self.current_stress <= 0.3:
-            return "Low"
-        elif self.current_stress <= 0.6:
-            return "Medium"
-        else:
-            return "High"
+        return self.get_category(self.current_stress)
+    
+    def get_category(self, value):
+        """Map a 0-1 level to its category label (NaN falls through to High)"""
+        if math.isnan(value):
+            return self.CATEGORY_LABELS[-1]
+        return self.CATEGORY_LABELS[bisect.bisect_left(self.CATEGORY_THRESHOLDS, value)]
 
 
 def main(args=None):
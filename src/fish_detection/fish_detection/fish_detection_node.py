@@ -144,22 +144,8 @@ class FishDetectionNode(Node):
             count_msg.data = fish_count
             self.fish_count_pub.publish(count_msg)
 
-            detections = []
-            if len(indices) > 0:
-                for i in indices.flatten():
-                    x, y, box_width, box_height = boxes[i]
-                    detections.append({
-                        'bbox': [int(x), int(y), int(box_width), int(box_height)],
-                        'confidence': float(confidences[i]),
-                    })
-
-            detections_msg = String()
-            detections_msg.data = json.dumps({
-                'timestamp': self.get_clock().now().nanoseconds,
-                'fish_count': fish_count,
-                'detections': detections,
-            })
-            self.detections_pub.publish(detections_msg)
+            if self.detections_pub.get_subscription_count() > 0:
+                self._publish_detections(boxes, confidences, indices, fish_count)
 
             if self.publish_annotated or self.display_window:
                 self._draw_detections(cv_image, boxes, confidences, indices, fish_count)
@@ -185,6 +171,24 @@ class FishDetectionNode(Node):
         except Exception as exc:
             self.get_logger().error(f'Error processing image: {exc}')
 
+    def _publish_detections(self, boxes, confidences, indices, fish_count):
+        detections = []
+        if len(indices) > 0:
+            for i in indices.flatten():
+                x, y, box_width, box_height = boxes[i]
+                detections.append({
+                    'bbox': [int(x), int(y), int(box_width), int(box_height)],
+                    'confidence': float(confidences[i]),
+                })
+
+        detections_msg = String()
+        detections_msg.data = json.dumps({
+            'timestamp': self.get_clock().now().nanoseconds,
+            'fish_count': fish_count,
+            'detections': detections,
+        }, separators=(',', ':'))
+        self.detections_pub.publish(detections_msg)
+
     def _draw_detections(self, cv_image, boxes, confidences, indices, fish_count):
         if fish_count <= 0:
             return
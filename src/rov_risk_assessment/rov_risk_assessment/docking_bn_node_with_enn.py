@@ -21,14 +21,16 @@ Author: Badawi - PhD Research
 
 import rclpy
 from rclpy.node import Node
+from rclpy.logging import LoggingSeverity
+from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy
 from std_msgs.msg import Float32, String, Int32, Bool
 from geometry_msgs.msg import PoseStamped
 from nav_msgs.msg import Odometry
 from sensor_msgs.msg import Imu
 import pysmile
 import math
+import bisect
 import numpy as np
-from datetime import datetime
 from ament_index_python.packages import get_package_share_directory
 from collections import deque
 import os
@@ -66,6 +68,20 @@ pysmile.License((
 
 
 class DockingBayesianNetworkWithENN(Node):
+    # DockingStationDetection state by ArUco visibility when the station is detected:
+    # All → Detected, Some → Partial, else NotDetected
+    DETECTION_STATE_MAP = {'All': 0, 'Some': 1}
+
+    # USBLStrength states: Strong (0), Moderate (1), Weak (2), Lost (3)
+    USBL_STATE_MAP = {'strong': 0, 'moderate': 1, 'weak': 2, 'lost': 3}
+    # CameraQuality states: Excellent (0), Good (1), Poor (2), Failed (3)
+    CAMERA_STATE_MAP = {'excellent': 0, 'good': 1, 'poor': 2, 'failed': 3}
+    # ArUcoMarkersVisible states: All (0), Some (1), None (2)
+    ARUCO_STATE_MAP = {'All': 0, 'Some': 1, 'None': 2}
+
+    # Expected value of each reliability state (VeryHigh ... VeryLow)
+    RELIABILITY_VALUES = (0.975, 0.90, 0.775, 0.60, 0.375)
+
     def __init__(self):
         super().__init__('docking_bayesian_network_enn')
 
@@ -159,8 +175,8 @@ class DockingBayesianNetworkWithENN(Node):
         self.enn_uncertainty_speed = 1.0
 
         # Pose history for quality assessment
-        self.pose_history = []
         self.max_history = 20
+        self.pose_history = deque(maxlen=self.max_history)
 
         # Mission timer
         self.mission_start_time = self.get_clock().now()
@@ -187,6 +203,13 @@ class DockingBayesianNetworkWithENN(Node):
     def setup_subscribers(self):
         """Setup ROS2 topic subscribers"""
 
+        # Numeric telemetry: only the latest sample matters, so keep one and
+        # skip DDS retransmits
+        scalar_qos = QoSProfile(
+            history=HistoryPolicy.KEEP_LAST,
+            depth=1,
+            reliability=ReliabilityPolicy.BEST_EFFORT)
+
         # Odometry (for ENN features)
         self.odom_sub = self.create_subscription(
             Odometry, '/blueye/odometry_flu/gt', self.odom_callback, 10)
@@ -198,16 +221,16 @@ class DockingBayesianNetworkWithENN(Node):
         # Thrusters (for ENN features)
         self.thruster1_sub = self.create_subscription(
             Float32, '/blueye/thruster_1/cmd_vel',
-            lambda msg: self.thruster_callback(msg, 0), 10)
+            lambda msg: self.thruster_callback(msg, 0), scalar_qos)
         self.thruster2_sub = self.create_subscription(
             Float32, '/blueye/thruster_2/cmd_vel',
-            lambda msg: self.thruster_callback(msg, 1), 10)
+            lambda msg: self.thruster_callback(msg, 1), scalar_qos)
         self.thruster3_sub = self.create_subscription(
             Float32, '/blueye/thruster_3/cmd_vel',
-            lambda msg: self.thruster_callback(msg, 2), 10)
+            lambda msg: self.thruster_callback(msg, 2), scalar_qos)
         self.thruster4_sub = self.create_subscription(
             Float32, '/blueye/thruster_4/cmd_vel',
-            lambda msg: self.thruster_callback(msg, 3), 10)
+            lambda msg: self.thruster_callback(msg, 3), scalar_qos)
 
         # Other sensors (original)
         self.usbl_sub = self.create_subscription(
@@ -215,9 +238,9 @@ class DockingBayesianNetworkWithENN(Node):
         self.camera_sub = self.create_subscription(
             String, '/blueye/camera_quality', self.camera_callback, 10)
         self.battery_sub = self.create_subscription(
-            Float32, '/blueye/battery_level', self.battery_callback, 10)
+            Float32, '/blueye/battery_level', self.battery_callback, scalar_qos)
         self.current_sub = self.create_subscription(
-            Float32, '/blueye/current', self.current_callback, 10)
+            Float32, '/blueye/current', self.current_callback, scalar_qos)
 
         # Docking-specific
         self.aruco_visibility_sub = self.create_subscription(
@@ -225,16 +248,16 @@ class DockingBayesianNetworkWithENN(Node):
         self.docking_detected_sub = self.create_subscription(
             Bool, '/blueye/docking_station_detected', self.docking_detected_callback, 10)
         self.fish_count_sub = self.create_subscription(
-            Int32, '/fish_detection/count', self.fish_count_callback, 10)
+            Int32, '/fish_detection/count', self.fish_count_callback, scalar_qos)
         self.pose_sub = self.create_subscription(
             PoseStamped, '/blueye/pose_estimated_board_stamped',
             self.pose_callback, 10)
 
         # Human operator state
         self.fatigue_sub = self.create_subscription(
-            Float32, '/blueye/human/fatigue', self.fatigue_callback, 10)
+            Float32, '/blueye/human/fatigue', self.fatigue_callback, scalar_qos)
         self.stress_sub = self.create_subscription(
-            Float32, '/blueye/human/stress', self.stress_callback, 10)
+            Float32, '/blueye/human/stress', self.stress_callback, scalar_qos)
 
         self.get_logger().info('✓ All ROS2 subscribers initialized')
 
@@ -252,6 +275,17 @@ class DockingBayesianNetworkWithENN(Node):
         self.enn_uncertainty_alt_pub = self.create_publisher(Float32, '/docking/enn_uncertainty_altitude', 10)
         self.enn_uncertainty_spd_pub = self.create_publisher(Float32, '/docking/enn_uncertainty_speed', 10)
 
+        # Output messages are reused across ticks; only .data changes
+        self.mode_msg = String()
+        self.reliability_msg = Float32()
+        self.visual_guidance_msg = String()
+        self.approach_feasibility_msg = String()
+        self.mode_auto_msg = Float32()
+        self.mode_human_msg = Float32()
+        self.mode_shared_msg = Float32()
+        self.enn_uncertainty_alt_msg = Float32()
+        self.enn_uncertainty_spd_msg = Float32()
+
         self.get_logger().info('✓ Docking output publishers initialized')
 
     # ============================================
@@ -379,13 +413,11 @@ class DockingBayesianNetworkWithENN(Node):
             self.enn_uncertainty_speed = unc_spd
 
             # Publish uncertainties
-            unc_alt_msg = Float32()
-            unc_alt_msg.data = float(unc_alt)
-            self.enn_uncertainty_alt_pub.publish(unc_alt_msg)
+            self.enn_uncertainty_alt_msg.data = float(unc_alt)
+            self.enn_uncertainty_alt_pub.publish(self.enn_uncertainty_alt_msg)
 
-            unc_spd_msg = Float32()
-            unc_spd_msg.data = float(unc_spd)
-            self.enn_uncertainty_spd_pub.publish(unc_spd_msg)
+            self.enn_uncertainty_spd_msg.data = float(unc_spd)
+            self.enn_uncertainty_spd_pub.publish(self.enn_uncertainty_spd_msg)
 
         except Exception as e:
             self.get_logger().error(f'ENN inference failed: {e}')
@@ -431,8 +463,7 @@ class DockingBayesianNetworkWithENN(Node):
         usbl_str = msg.data.lower()
         self.sensor_data['usbl_strength'] = usbl_str
 
-        state_map = {'strong': 0, 'moderate': 1, 'weak': 2, 'lost': 3}
-        state = state_map.get(usbl_str, 2)
+        state = self.USBL_STATE_MAP.get(usbl_str, 2)
 
         try:
             self.net.set_evidence("USBLStrength", state)
@@ -444,8 +475,7 @@ class DockingBayesianNetworkWithENN(Node):
         camera_str = msg.data.lower()
         self.sensor_data['camera_quality'] = camera_str
 
-        state_map = {'excellent': 0, 'good': 1, 'poor': 2, 'failed': 3}
-        state = state_map.get(camera_str, 2)
+        state = self.CAMERA_STATE_MAP.get(camera_str, 2)
 
         try:
             self.net.set_evidence("CameraQuality", state)
@@ -476,8 +506,7 @@ class DockingBayesianNetworkWithENN(Node):
         visibility = msg.data
         self.sensor_data['aruco_visibility'] = visibility
 
-        state_map = {'All': 0, 'Some': 1, 'None': 2}
-        state = state_map.get(visibility, 2)
+        state = self.ARUCO_STATE_MAP.get(visibility, 2)
 
         try:
             self.net.set_evidence("ArUcoMarkersVisible", state)
@@ -491,12 +520,7 @@ class DockingBayesianNetworkWithENN(Node):
 
         aruco_vis = self.sensor_data.get('aruco_visibility', 'None')
 
-        if detected and aruco_vis == 'All':
-            state = 0  # Detected
-        elif detected and aruco_vis == 'Some':
-            state = 1  # Partial
-        else:
-            state = 2  # NotDetected
+        state = self.DETECTION_STATE_MAP.get(aruco_vis, 2) if detected else 2
 
         try:
             self.net.set_evidence("DockingStationDetection", state)
@@ -532,9 +556,6 @@ class DockingBayesianNetworkWithENN(Node):
             'z': msg.pose.position.z,
         })
 
-        if len(self.pose_history) > self.max_history:
-            self.pose_history.pop(0)
-
         if len(self.pose_history) >= 10:
             variance = self.calculate_position_variance()
 
@@ -596,9 +617,10 @@ class DockingBayesianNetworkWithENN(Node):
             probs = self.enn_probs_altitude.tolist()
             try:
                 self.net.set_virtual_evidence("Altitude", probs)
-                self.get_logger().debug(
-                    f'Altitude (ENN): probs={probs}, unc={self.enn_uncertainty_altitude:.3f}'
-                )
+                if self.get_logger().is_enabled_for(LoggingSeverity.DEBUG):
+                    self.get_logger().debug(
+                        f'Altitude (ENN): probs={probs}, unc={self.enn_uncertainty_altitude:.3f}'
+                    )
                 return 'enn'
             except Exception as e:
                 self.get_logger().warning(f'Failed to set virtual evidence for Altitude: {e}')
@@ -637,9 +659,10 @@ class DockingBayesianNetworkWithENN(Node):
             probs = self.enn_probs_speed.tolist()
             try:
                 self.net.set_virtual_evidence("Speed", probs)
-                self.get_logger().debug(
-                    f'Speed (ENN): probs={probs}, unc={self.enn_uncertainty_speed:.3f}'
-                )
+                if self.get_logger().is_enabled_for(LoggingSeverity.DEBUG):
+                    self.get_logger().debug(
+                        f'Speed (ENN): probs={probs}, unc={self.enn_uncertainty_speed:.3f}'
+                    )
                 return 'enn'
             except Exception as e:
                 self.get_logger().warning(f'Failed to set virtual evidence for Speed: {e}')
@@ -687,8 +710,7 @@ class DockingBayesianNetworkWithENN(Node):
             approach_feas_states = self.net.get_outcome_ids("ApproachFeasibility")
 
             # Calculate expected reliabilities
-            reliability_values = [0.975, 0.90, 0.775, 0.60, 0.375]
-            expected_docking_rel = sum(p * v for p, v in zip(docking_rel_probs, reliability_values))
+            expected_docking_rel = sum(p * v for p, v in zip(docking_rel_probs, self.RELIABILITY_VALUES))
 
             # Find best modes
             best_mode_idx = mode_probs.index(max(mode_probs))
@@ -702,79 +724,85 @@ class DockingBayesianNetworkWithENN(Node):
             approach_status = approach_feas_states[best_approach_idx]
 
             # Publish outputs
-            mode_msg = String()
-            mode_msg.data = recommended_mode
-            self.mode_pub.publish(mode_msg)
+            self.mode_msg.data = recommended_mode
+            self.mode_pub.publish(self.mode_msg)
 
-            rel_msg = Float32()
-            rel_msg.data = float(expected_docking_rel)
-            self.reliability_pub.publish(rel_msg)
+            self.reliability_msg.data = float(expected_docking_rel)
+            self.reliability_pub.publish(self.reliability_msg)
 
-            visual_msg = String()
-            visual_msg.data = visual_quality
-            self.visual_guidance_pub.publish(visual_msg)
+            self.visual_guidance_msg.data = visual_quality
+            self.visual_guidance_pub.publish(self.visual_guidance_msg)
 
-            approach_msg = String()
-            approach_msg.data = approach_status
-            self.approach_feasibility_pub.publish(approach_msg)
+            self.approach_feasibility_msg.data = approach_status
+            self.approach_feasibility_pub.publish(self.approach_feasibility_msg)
 
             # Publish mode probabilities
-            auto_msg = Float32()
-            auto_msg.data = float(mode_probs[0])
-            self.mode_auto_pub.publish(auto_msg)
-
-            human_msg = Float32()
-            human_msg.data = float(mode_probs[1])
-            self.mode_human_pub.publish(human_msg)
-
-            shared_msg = Float32()
-            shared_msg.data = float(mode_probs[2])
-            self.mode_shared_pub.publish(shared_msg)
-
-            # Logging
-            self.get_logger().info('=' * 70)
-            self.get_logger().info('DOCKING BN + ENN RISK ASSESSMENT')
-            self.get_logger().info('=' * 70)
-
-            self.get_logger().info(f'\n🧠 EVIDENCE METHOD:')
-            self.get_logger().info(f'  Altitude: {alt_method.upper()}' +
-                (f' (unc={self.enn_uncertainty_altitude:.3f})' if alt_method == 'enn' else ''))
-            self.get_logger().info(f'  Speed: {spd_method.upper()}' +
-                (f' (unc={self.enn_uncertainty_speed:.3f})' if spd_method == 'enn' else ''))
-
-            if self.enn_probs_altitude is not None:
-                self.get_logger().info(f'\n📊 ENN PROBABILITIES:')
-                self.get_logger().info(f'  Altitude: Safe={self.enn_probs_altitude[0]:.3f}, '
-                    f'Marginal={self.enn_probs_altitude[1]:.3f}, Unsafe={self.enn_probs_altitude[2]:.3f}')
-                self.get_logger().info(f'  Speed: Safe={self.enn_probs_speed[0]:.3f}, '
-                    f'Moderate={self.enn_probs_speed[1]:.3f}, High={self.enn_probs_speed[2]:.3f}')
-
-            self.get_logger().info(f'\n🎯 DOCKING ASSESSMENT:')
-            self.get_logger().info(f'  Visual Guidance: {visual_quality}')
-            self.get_logger().info(f'  Approach Feasibility: {approach_status}')
-            self.get_logger().info(f'  Docking Reliability: {expected_docking_rel:.3f}')
-
-            self.get_logger().info(f'\n✨ MODE RECOMMENDATION:')
-            self.get_logger().info(f'  Autonomous: {mode_probs[0]:6.2%}')
-            self.get_logger().info(f'  Human:      {mode_probs[1]:6.2%}')
-            self.get_logger().info(f'  Shared:     {mode_probs[2]:6.2%}')
-            self.get_logger().info(f'  ➜ RECOMMENDED: {recommended_mode.upper()} ({mode_confidence:.1%})')
-
-            self.get_logger().info('=' * 70 + '\n')
+            self.mode_auto_msg.data = float(mode_probs[0])
+            self.mode_auto_pub.publish(self.mode_auto_msg)
+
+            self.mode_human_msg.data = float(mode_probs[1])
+            self.mode_human_pub.publish(self.mode_human_msg)
+
+            self.mode_shared_msg.data = float(mode_probs[2])
+            self.mode_shared_pub.publish(self.mode_shared_msg)
+
+            # Logging (the dashboard is only built when INFO output is enabled)
+            if self.get_logger().is_enabled_for(LoggingSeverity.INFO):
+                self.log_status(alt_method, spd_method, visual_quality, approach_status,
+                                expected_docking_rel, mode_probs, recommended_mode,
+                                mode_confidence)
 
         except Exception as e:
             self.get_logger().error(f'Periodic update error: {e}')
 
+    def log_status(self, alt_method, spd_method, visual_quality, approach_status,
+                   expected_docking_rel, mode_probs, recommended_mode, mode_confidence):
+        """Log the docking BN + ENN dashboard as a single multi-line record"""
+        alt_unc = f' (unc={self.enn_uncertainty_altitude:.3f})' if alt_method == 'enn' else ''
+        spd_unc = f' (unc={self.enn_uncertainty_speed:.3f})' if spd_method == 'enn' else ''
+
+        enn_section = ''
+        if self.enn_probs_altitude is not None:
+            enn_section = (
+                '\n📊 ENN PROBABILITIES:\n'
+                f'  Altitude: Safe={self.enn_probs_altitude[0]:.3f}, '
+                f'Marginal={self.enn_probs_altitude[1]:.3f}, Unsafe={self.enn_probs_altitude[2]:.3f}\n'
+                f'  Speed: Safe={self.enn_probs_speed[0]:.3f}, '
+                f'Moderate={self.enn_probs_speed[1]:.3f}, High={self.enn_probs_speed[2]:.3f}\n'
+            )
+
+        self.get_logger().info(
+            f'{"=" * 70}\n'
+            'DOCKING BN + ENN RISK ASSESSMENT\n'
+            f'{"=" * 70}\n'
+            '\n🧠 EVIDENCE METHOD:\n'
+            f'  Altitude: {alt_method.upper()}{alt_unc}\n'
+            f'  Speed: {spd_method.upper()}{spd_unc}\n'
+            f'{enn_section}'
+            '\n🎯 DOCKING ASSESSMENT:\n'
+            f'  Visual Guidance: {visual_quality}\n'
+            f'  Approach Feasibility: {approach_status}\n'
+            f'  Docking Reliability: {expected_docking_rel:.3f}\n'
+            '\n✨ MODE RECOMMENDATION:\n'
+            f'  Autonomous: {mode_probs[0]:6.2%}\n'
+            f'  Human:      {mode_probs[1]:6.2%}\n'
+            f'  Shared:     {mode_probs[2]:6.2%}\n'
+            f'  ➜ RECOMMENDED: {recommended_mode.upper()} ({mode_confidence:.1%})\n'
+            f'{"=" * 70}\n'
+        )
+
     # ============================================
     # UTILITY FUNCTIONS
     # ============================================
 
     def discretize(self, value: float, thresholds: list) -> int:
         """Convert continuous value to discrete state"""
-        for i, threshold in enumerate(thresholds):
-            if value <= threshold:
-                return i
-        return len(thresholds)
+        # NaN compares false against every threshold; map it to the last
+        # (least favourable) state as the original loop did
+        if math.isnan(value):
+            return len(thresholds)
+        # First index whose threshold is >= value
+        return bisect.bisect_left(thresholds, value)
 
     def calculate_position_variance(self):
         """Calculate position variance for pose quality"""
@@ -39,11 +39,14 @@ Network: integrated_mission_control.xdsl (270-node Bayesian Network)
 
 import rclpy
 from rclpy.node import Node
+from rclpy.logging import LoggingSeverity
+from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy
 from std_msgs.msg import Float32, String, Int32
 from geometry_msgs.msg import PoseStamped
 import pysmile
 import math
-from datetime import datetime
+from collections import deque
+import bisect
 from ament_index_python.packages import get_package_share_directory
 import os
 
@@ -68,6 +71,24 @@ pysmile.License((
 
 
 class MissionControlBayesianNetwork(Node):
+    # USBLStrength states: Strong (0), Moderate (1), Weak (2), Lost (3)
+    USBL_STATE_MAP = {'strong': 0, 'moderate': 1, 'weak': 2, 'lost': 3}
+    # CameraQuality states: Excellent (0), Good (1), Poor (2), Failed (3)
+    CAMERA_STATE_MAP = {'excellent': 0, 'good': 1, 'poor': 2, 'failed': 3}
+    # MissionPhase states: Undocking (0), Transit (1), Inspection (2),
+    #                      DockingApproach (3), Docking (4), Charging (5)
+    PHASE_STATE_MAP = {
+        'undocking': 0,
+        'transit': 1,
+        'inspection': 2,
+        'dockingapproach': 3,
+        'docking': 4,
+        'charging': 5
+    }
+
+    # Expected value of each reliability state (VeryHigh ... VeryLow)
+    RELIABILITY_VALUES = (0.975, 0.90, 0.775, 0.60, 0.375)
+
     def __init__(self):
         super().__init__('mission_control_bayesian_network')
         try:
@@ -114,8 +135,13 @@ class MissionControlBayesianNetwork(Node):
         }
 
         # Historical data for stability and quality calculations
-        self.pose_history = []
         self.max_history = 20
+        self.pose_history = deque(maxlen=self.max_history)
+
+        # Last hard-evidence state set on each BN node
+        self.evidence_states = {}
+        # Set when evidence changes so inference only reruns when needed
+        self.beliefs_stale = True
 
         # Setup ROS2 subscribers
         self.setup_subscribers()
@@ -128,10 +154,17 @@ class MissionControlBayesianNetwork(Node):
 
     def setup_subscribers(self):
         """Setup ROS2 topic subscribers for all sensor inputs"""
-        
+
+        # Numeric telemetry: only the latest sample matters, so keep one and
+        # skip DDS retransmits
+        scalar_qos = QoSProfile(
+            history=HistoryPolicy.KEEP_LAST,
+            depth=1,
+            reliability=ReliabilityPolicy.BEST_EFFORT)
+
         # Autonomous Control sensors
         self.speed_sub = self.create_subscription(
-            Float32, '/blueye/speed', self.speed_callback, 10)
+            Float32, '/blueye/speed', self.speed_callback, scalar_qos)
         
         self.usbl_sub = self.create_subscription(
             String, '/blueye/usbl_strength', self.usbl_callback, 10)
@@ -140,23 +173,23 @@ class MissionControlBayesianNetwork(Node):
             String, '/blueye/camera_quality', self.camera_callback, 10)
         
         self.battery_sub = self.create_subscription(
-            Float32, '/blueye/battery_level', self.battery_callback, 10)
+            Float32, '/blueye/battery_level', self.battery_callback, scalar_qos)
         
         self.altitude_sub = self.create_subscription(
-            Float32, '/blueye/altitude', self.altitude_callback, 10)
+            Float32, '/blueye/altitude', self.altitude_callback, scalar_qos)
         
         self.pose_sub = self.create_subscription(
             PoseStamped, '/blueye/pose', self.pose_callback, 10)
         
         # Environmental conditions
         self.current_sub = self.create_subscription(
-            Float32, '/blueye/current', self.current_callback, 10)
+            Float32, '/blueye/current', self.current_callback, scalar_qos)
         
         self.wind_sub = self.create_subscription(
-            Float32, '/blueye/wind', self.wind_callback, 10)
+            Float32, '/blueye/wind', self.wind_callback, scalar_qos)
         
         self.waves_sub = self.create_subscription(
-            Float32, '/blueye/waves', self.waves_callback, 10)
+            Float32, '/blueye/waves', self.waves_callback, scalar_qos)
         
         # Mission context
         self.mission_phase_sub = self.create_subscription(
@@ -164,13 +197,13 @@ class MissionControlBayesianNetwork(Node):
         
         # Human operator states (if available - optional)
         self.fatigue_sub = self.create_subscription(
-            Float32, '/blueye/human/fatigue', self.fatigue_callback, 10)
+            Float32, '/blueye/human/fatigue', self.fatigue_callback, scalar_qos)
         
         self.stress_sub = self.create_subscription(
-            Float32, '/blueye/human/stress', self.stress_callback, 10)
+            Float32, '/blueye/human/stress', self.stress_callback, scalar_qos)
         
         self.attention_sub = self.create_subscription(
-            Float32, '/blueye/human/attention', self.attention_callback, 10)
+            Float32, '/blueye/human/attention', self.attention_callback, scalar_qos)
 
         self.get_logger().info('✓ All ROS2 subscribers initialized')
 
@@ -194,7 +227,7 @@ class MissionControlBayesianNetwork(Node):
             state = 2  # High
         
         try:
-            self.net.set_evidence("Speed", state)
+            self.set_evidence("Speed", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Speed evidence: {e}')
 
@@ -204,17 +237,10 @@ class MissionControlBayesianNetwork(Node):
         self.sensor_data['usbl_strength'] = usbl_str
         
         # USBLStrength states: Strong (0), Moderate (1), Weak (2), Lost (3)
-        state_map = {
-            'strong': 0,
-            'moderate': 1,
-            'weak': 2,
-            'lost': 3
-        }
-        
-        state = state_map.get(usbl_str, 2)  # Default to Weak
+        state = self.USBL_STATE_MAP.get(usbl_str, 2)  # Default to Weak
         
         try:
-            self.net.set_evidence("USBLStrength", state)
+            self.set_evidence("USBLStrength", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set USBLStrength evidence: {e}')
 
@@ -224,17 +250,10 @@ class MissionControlBayesianNetwork(Node):
         self.sensor_data['camera_quality'] = camera_str
         
         # CameraQuality states: Excellent (0), Good (1), Poor (2), Failed (3)
-        state_map = {
-            'excellent': 0,
-            'good': 1,
-            'poor': 2,
-            'failed': 3
-        }
-        
-        state = state_map.get(camera_str, 2)  # Default to Poor
+        state = self.CAMERA_STATE_MAP.get(camera_str, 2)  # Default to Poor
         
         try:
-            self.net.set_evidence("CameraQuality", state)
+            self.set_evidence("CameraQuality", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set CameraQuality evidence: {e}')
 
@@ -254,7 +273,7 @@ class MissionControlBayesianNetwork(Node):
             state = 3  # Critical
         
         try:
-            self.net.set_evidence("BatteryLevel", state)
+            self.set_evidence("BatteryLevel", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set BatteryLevel evidence: {e}')
 
@@ -272,7 +291,7 @@ class MissionControlBayesianNetwork(Node):
             state = 2  # Unsafe (< 1m)
         
         try:
-            self.net.set_evidence("Altitude", state)
+            self.set_evidence("Altitude", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Altitude evidence: {e}')
 
@@ -299,12 +318,8 @@ class MissionControlBayesianNetwork(Node):
             'x': msg.pose.position.x,
             'y': msg.pose.position.y,
             'z': msg.pose.position.z,
-            'timestamp': self.get_clock().now()
         })
         
-        if len(self.pose_history) > self.max_history:
-            self.pose_history.pop(0)
-        
         # Calculate pose estimation quality based on stability
         # PoseEstimationQuality states: High (0), Medium (1), Low (2)
         if len(self.pose_history) >= 10:
@@ -320,7 +335,7 @@ class MissionControlBayesianNetwork(Node):
             state = 1  # Default to Medium until we have enough history
         
         try:
-            self.net.set_evidence("PoseEstimationQuality", state)
+            self.set_evidence("PoseEstimationQuality", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set PoseEstimationQuality evidence: {e}')
 
@@ -342,7 +357,7 @@ class MissionControlBayesianNetwork(Node):
             state = 2  # High
         
         try:
-            self.net.set_evidence("Current", state)
+            self.set_evidence("Current", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Current evidence: {e}')
 
@@ -360,7 +375,7 @@ class MissionControlBayesianNetwork(Node):
             state = 2  # High
         
         try:
-            self.net.set_evidence("Wind", state)
+            self.set_evidence("Wind", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Wind evidence: {e}')
 
@@ -378,7 +393,7 @@ class MissionControlBayesianNetwork(Node):
             state = 2  # High
         
         try:
-            self.net.set_evidence("Waves", state)
+            self.set_evidence("Waves", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Waves evidence: {e}')
 
@@ -391,21 +406,10 @@ class MissionControlBayesianNetwork(Node):
         phase_str = msg.data.lower()
         self.sensor_data['mission_phase'] = phase_str
         
-        # MissionPhase states: Undocking (0), Transit (1), Inspection (2), 
-        #                       DockingApproach (3), Docking (4), Charging (5)
-        phase_map = {
-            'undocking': 0,
-            'transit': 1,
-            'inspection': 2,
-            'dockingapproach': 3,
-            'docking': 4,
-            'charging': 5
-        }
-        
-        state = phase_map.get(phase_str, 1)  # Default to Transit
+        state = self.PHASE_STATE_MAP.get(phase_str, 1)  # Default to Transit
         
         try:
-            self.net.set_evidence("MissionPhase", state)
+            self.set_evidence("MissionPhase", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set MissionPhase evidence: {e}')
 
@@ -421,7 +425,7 @@ class MissionControlBayesianNetwork(Node):
         state = self.discretize(fatigue, [0.3, 0.6])
         
         try:
-            self.net.set_evidence("Fatigue", state)
+            self.set_evidence("Fatigue", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Fatigue evidence: {e}')
 
@@ -433,7 +437,7 @@ class MissionControlBayesianNetwork(Node):
         state = self.discretize(stress, [0.3, 0.6])
         
         try:
-            self.net.set_evidence("Stress", state)
+            self.set_evidence("Stress", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Stress evidence: {e}')
 
@@ -445,7 +449,7 @@ class MissionControlBayesianNetwork(Node):
         state = self.discretize(attention, [0.4, 0.7])
         
         try:
-            self.net.set_evidence("Attention", state)
+            self.set_evidence("Attention", state)
         except Exception as e:
             self.get_logger().warning(f'Failed to set Attention evidence: {e}')
 
@@ -456,97 +460,116 @@ class MissionControlBayesianNetwork(Node):
     def periodic_update(self):
         """Periodic network inference and logging"""
         try:
-            # Run inference
-            self.net.update_beliefs()
+            # Run inference (posteriors are unchanged if no evidence changed)
+            if self.beliefs_stale:
+                self.net.update_beliefs()
+                self.beliefs_stale = False
             
             # Get key results
-            human_rel_probs = self.net.get_node_value("HumanDecisionReliability")
-            auto_rel_probs = self.net.get_node_value("AutonomousControlReliability")
             mode_probs = self.net.get_node_value("MissionModeRecommendation")
             mode_states = self.net.get_outcome_ids("MissionModeRecommendation")
             
-            # Calculate expected reliabilities
-            reliability_values = [0.975, 0.90, 0.775, 0.60, 0.375]
-            expected_human_rel = sum(p * v for p, v in zip(human_rel_probs, reliability_values))
-            expected_auto_rel = sum(p * v for p, v in zip(auto_rel_probs, reliability_values))
-            
             # Find recommended mode
             best_mode_idx = mode_probs.index(max(mode_probs))
             recommended_mode = mode_states[best_mode_idx]
             confidence = mode_probs[best_mode_idx]
             
-            # Log results
-            self.get_logger().info('=' * 70)
-            self.get_logger().info('MISSION CONTROL BAYESIAN NETWORK STATE')
-            self.get_logger().info('=' * 70)
-            
-            # Sensor data
-            self.get_logger().info('\n📡 SENSOR DATA:')
-            self.get_logger().info(f'  Speed: {self.sensor_data.get("speed", "N/A")} m/s')
-            self.get_logger().info(f'  USBL Strength: {self.sensor_data.get("usbl_strength", "N/A")}')
-            self.get_logger().info(f'  Camera Quality: {self.sensor_data.get("camera_quality", "N/A")}')
-            self.get_logger().info(f'  Battery: {self.sensor_data.get("battery_level", "N/A")}%')
-            self.get_logger().info(f'  Altitude: {self.sensor_data.get("altitude", "N/A")} m')
-            
-            # Environmental conditions
-            self.get_logger().info('\n🌊 ENVIRONMENTAL CONDITIONS:')
-            self.get_logger().info(f'  Current: {self.sensor_data.get("current", "N/A")} m/s')
-            self.get_logger().info(f'  Wind: {self.sensor_data.get("wind", "N/A")} m/s')
-            self.get_logger().info(f'  Waves: {self.sensor_data.get("waves", "N/A")} m')
-            
-            # Mission context
-            self.get_logger().info('\n🎯 MISSION CONTEXT:')
-            self.get_logger().info(f'  Phase: {self.sensor_data.get("mission_phase", "N/A")}')
-            
-            # Pose data
-            if self.sensor_data.get('roll') is not None:
-                self.get_logger().info('\n📐 POSE:')
-                self.get_logger().info(f'  Position: ({self.sensor_data.get("pose_x", 0):.2f}, '
-                                      f'{self.sensor_data.get("pose_y", 0):.2f}, '
-                                      f'{self.sensor_data.get("pose_z", 0):.2f})')
-                self.get_logger().info(f'  Roll: {math.degrees(self.sensor_data["roll"]):.1f}°')
-                self.get_logger().info(f'  Pitch: {math.degrees(self.sensor_data["pitch"]):.1f}°')
-                self.get_logger().info(f'  Yaw: {math.degrees(self.sensor_data["yaw"]):.1f}°')
-            
-            # Reliability assessments
-            self.get_logger().info('\n🤖 RELIABILITY ASSESSMENT:')
-            self.get_logger().info(f'  Human Operator Reliability: {expected_human_rel:.3f}')
-            self.get_logger().info(f'  Autonomous Control Reliability: {expected_auto_rel:.3f}')
-            
-            # Mode recommendation
-            self.get_logger().info('\n✨ MISSION MODE RECOMMENDATION:')
-            self.get_logger().info(f'  Autonomous: {mode_probs[0]:6.2%}  {"█" * int(mode_probs[0] * 30)}')
-            self.get_logger().info(f'  Human:      {mode_probs[1]:6.2%}  {"█" * int(mode_probs[1] * 30)}')
-            self.get_logger().info(f'  Shared:     {mode_probs[2]:6.2%}  {"█" * int(mode_probs[2] * 30)}')
-            self.get_logger().info(f'\n  ➜ RECOMMENDED: {recommended_mode.upper()} (Confidence: {confidence:.1%})')
+            # Log results (the dashboard is only built when INFO output is enabled)
+            if self.get_logger().is_enabled_for(LoggingSeverity.INFO):
+                self.log_status(mode_probs, recommended_mode, confidence)
             
             if confidence < 0.5:
                 self.get_logger().warn('  ⚠️  WARNING: Low confidence - consider shared control')
             
-            self.get_logger().info('=' * 70 + '\n')
-            
         except Exception as e:
             self.get_logger().warning(f'Could not update network: {e}')
 
+    def log_status(self, mode_probs, recommended_mode, confidence):
+        """Log the mission status dashboard as a single multi-line record"""
+        human_rel_probs = self.net.get_node_value("HumanDecisionReliability")
+        auto_rel_probs = self.net.get_node_value("AutonomousControlReliability")
+        
+        # Calculate expected reliabilities
+        expected_human_rel = sum(p * v for p, v in zip(human_rel_probs, self.RELIABILITY_VALUES))
+        expected_auto_rel = sum(p * v for p, v in zip(auto_rel_probs, self.RELIABILITY_VALUES))
+        
+        data = self.sensor_data
+        
+        # Pose data (only once orientation has been received)
+        pose_section = ''
+        if data.get('roll') is not None:
+            pose_section = (
+                '\n📐 POSE:\n'
+                f'  Position: ({data.get("pose_x", 0):.2f}, '
+                f'{data.get("pose_y", 0):.2f}, '
+                f'{data.get("pose_z", 0):.2f})\n'
+                f'  Roll: {math.degrees(data["roll"]):.1f}°\n'
+                f'  Pitch: {math.degrees(data["pitch"]):.1f}°\n'
+                f'  Yaw: {math.degrees(data["yaw"]):.1f}°\n'
+            )
+        
+        self.get_logger().info(
+            f'{"=" * 70}\n'
+            'MISSION CONTROL BAYESIAN NETWORK STATE\n'
+            f'{"=" * 70}\n'
+            # Sensor data
+            '\n📡 SENSOR DATA:\n'
+            f'  Speed: {data.get("speed", "N/A")} m/s\n'
+            f'  USBL Strength: {data.get("usbl_strength", "N/A")}\n'
+            f'  Camera Quality: {data.get("camera_quality", "N/A")}\n'
+            f'  Battery: {data.get("battery_level", "N/A")}%\n'
+            f'  Altitude: {data.get("altitude", "N/A")} m\n'
+            # Environmental conditions
+            '\n🌊 ENVIRONMENTAL CONDITIONS:\n'
+            f'  Current: {data.get("current", "N/A")} m/s\n'
+            f'  Wind: {data.get("wind", "N/A")} m/s\n'
+            f'  Waves: {data.get("waves", "N/A")} m\n'
+            # Mission context
+            '\n🎯 MISSION CONTEXT:\n'
+            f'  Phase: {data.get("mission_phase", "N/A")}\n'
+            f'{pose_section}'
+            # Reliability assessments
+            '\n🤖 RELIABILITY ASSESSMENT:\n'
+            f'  Human Operator Reliability: {expected_human_rel:.3f}\n'
+            f'  Autonomous Control Reliability: {expected_auto_rel:.3f}\n'
+            # Mode recommendation
+            '\n✨ MISSION MODE RECOMMENDATION:\n'
+            f'  Autonomous: {mode_probs[0]:6.2%}  {"█" * int(mode_probs[0] * 30)}\n'
+            f'  Human:      {mode_probs[1]:6.2%}  {"█" * int(mode_probs[1] * 30)}\n'
+            f'  Shared:     {mode_probs[2]:6.2%}  {"█" * int(mode_probs[2] * 30)}\n'
+            f'\n  ➜ RECOMMENDED: {recommended_mode.upper()} (Confidence: {confidence:.1%})\n'
+            f'{"=" * 70}\n'
+        )
+
     # ============================================
     # UTILITY FUNCTIONS
     # ============================================
 
+    def set_evidence(self, node_id: str, state: int):
+        """Set hard evidence on a BN node, skipping repeats of the current state"""
+        if self.evidence_states.get(node_id) == state:
+            return
+        self.net.set_evidence(node_id, state)
+        self.evidence_states[node_id] = state
+        self.beliefs_stale = True
+
     def discretize(self, value: float, thresholds: list) -> int:
         """
         Convert continuous value to discrete state index
         
         Args:
             value: Continuous value (0-1)
-            thresholds: List of threshold values
+            thresholds: Ascending list of threshold values
             
         Returns:
             State index (0, 1, 2, ...)
         """
-        for i, threshold in enumerate(thresholds):
-            if value <= threshold:
-                return i
-        return len(thresholds)
+        # NaN compares false against every threshold; map it to the last
+        # (least favourable) state as the original loop did
+        if math.isnan(value):
+            return len(thresholds)
+        # First index whose threshold is >= value
+        return bisect.bisect_left(thresholds, value)
 
     def calculate_position_variance(self):
         """Calculate variance of position over history"""
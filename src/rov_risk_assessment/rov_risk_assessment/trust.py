@@ -8,9 +8,24 @@ import rclpy
 from rclpy.node import Node
 from std_msgs.msg import String
 import math
+import bisect
+from collections import deque
 
 
 class OperatorTrustNode(Node):
+    # Numeric value of each Autonomous Control Reliability state
+    RELIABILITY_MAP = {
+        'veryhigh': 1.0,
+        'high': 0.8,
+        'medium': 0.6,
+        'low': 0.4,
+        'verylow': 0.2
+    }
+
+    # Lower bounds (exclusive) of the Low, Medium and High trust states
+    TRUST_THRESHOLDS = (0.25, 0.5, 0.75)
+    TRUST_STATES = ('VeryLow', 'Low', 'Medium', 'High')
+
     def __init__(self):
         super().__init__('operator_trust_node')
         
@@ -24,8 +39,8 @@ class OperatorTrustNode(Node):
         self.gamma = 0.02  # Decay rate
         
         # History for consistency
-        self.reliability_history = []
         self.max_history = 10
+        self.reliability_history = deque(maxlen=self.max_history)
         
         # Subscribe to Autonomous Control Reliability
         self.auto_reliability_sub = self.create_subscription(
@@ -44,14 +59,7 @@ class OperatorTrustNode(Node):
     
     def reliability_callback(self, msg: String):
         """Autonomous Control Reliability: VeryHigh/High/Medium/Low/VeryLow"""
-        reliability_map = {
-            'veryhigh': 1.0,
-            'high': 0.8,
-            'medium': 0.6,
-            'low': 0.4,
-            'verylow': 0.2
-        }
-        self.auto_reliability = reliability_map.get(msg.data.lower(), 0.6)
+        self.auto_reliability = self.RELIABILITY_MAP.get(msg.data.lower(), 0.6)
     
     def update_trust(self):
         """ECT Trust Update"""
@@ -61,8 +69,6 @@ class OperatorTrustNode(Node):
         
         # 2. Update history
         self.reliability_history.append(self.auto_reliability)
-        if len(self.reliability_history) > self.max_history:
-            self.reliability_history.pop(0)
         
         # 3. Consistency
         consistency = self.calculate_consistency()
@@ -102,14 +108,7 @@ class OperatorTrustNode(Node):
     
     def categorize_trust(self, trust_value):
         """Convert to BN states"""
-        if trust_value > 0.75:
-            return "High"
-        elif trust_value > 0.5:
-            return "Medium"
-        elif trust_value > 0.25:
-            return "Low"
-        else:
-            return "VeryLow"
+        return self.TRUST_STATES[bisect.bisect_left(self.TRUST_THRESHOLDS, trust_value)]
 
 
 def main():
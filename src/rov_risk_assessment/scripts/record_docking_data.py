@@ -152,7 +152,8 @@ class DockingDataRecorder(Node):
     
     def record_data(self):
         """Record current data snapshot"""
-        elapsed = time.time() - self.start_time
+        now = time.time()
+        elapsed = now - self.start_time
         
         # Check if we should stop
         if self.duration and elapsed > self.duration:
@@ -160,8 +161,8 @@ class DockingDataRecorder(Node):
             self.save_and_exit()
             return
         
-        # Record timestamp
-        self.data['timestamps'].append(datetime.now().isoformat())
+        # Record timestamp (wall-clock seconds, formatted as ISO on save)
+        self.data['timestamps'].append(now)
         self.data['time'].append(elapsed)
         
         # Record all values (use None if not available yet)
@@ -198,8 +199,14 @@ class DockingDataRecorder(Node):
         self.get_logger().info(f'  Output: {self.output_file}')
         
         # Convert to JSON-serializable format
-        json_data = {}
+        json_data = {
+            'timestamps': [
+                datetime.fromtimestamp(t).isoformat() for t in self.data['timestamps']
+            ]
+        }
         for key, values in self.data.items():
+            if key == 'timestamps':
+                continue
             json_data[key] = [
                 float(v) if isinstance(v, (int, float)) else 
                 str(v) if v is not None else None 
@@ -208,7 +215,7 @@ class DockingDataRecorder(Node):
         
         # Save to file
         with open(self.output_file, 'w') as f:
-            json.dump(json_data, f, indent=2)
+            json.dump(json_data, f, separators=(',', ':'))
         
         self.get_logger().info(f'✅ Data saved to {self.output_file}')
         self.get_logger().info('=' * 60)